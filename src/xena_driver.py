@@ -47,7 +47,7 @@ class XenaController2GDriver(TgControllerDriver):
     def get_statistics(self, context: ResourceCommandContext, view_name: str, output_type: str) -> Union[dict, str]:
         """Get view statistics.
 
-        :param view_name: Statistics view - port, stream or tpld.
+        :param view_name: Statistics view - port, stream, tpld or all (all views in one snapshot).
         :param output_type: CSV or JSON.
         """
         return self.handler.get_statistics(context, view_name, output_type)
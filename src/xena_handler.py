@@ -8,8 +8,10 @@ import logging
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from cloudshell.shell.core.driver_context import InitCommandContext, ResourceCommandContext
 from cloudshell.traffic.helpers import (
@@ -79,25 +81,63 @@ class XenaHandler:
         self.xena.session.stop_traffic()
 
     def get_statistics(self, context: ResourceCommandContext, view_name: str, output_type: str) -> Union[dict, str]:
-        """Get statistics for the requested view."""
-        stats_obj = view_name_2_object[view_name.lower()](self.xena.session)
+        """Get statistics for the requested view.
+
+        View name "all" reads all views of all ports concurrently, one worker per port, into one snapshot.
+        """
+        view = view_name.lower().strip()
+        if view == "all":
+            return self._get_all_statistics(context, output_type)
+        if view not in view_name_2_object:
+            raise TgnError(f"View name should be Port/Stream/TPLD/All - got '{view_name}'")
+        stats_obj = view_name_2_object[view](self.xena.session)
         stats_obj.read_stats()
         if output_type.lower().strip() == "json":
             statistics_str = json.dumps(stats_obj.get_flat_stats(), indent=4, sort_keys=True, ensure_ascii=False)
             return json.loads(statistics_str)
         if output_type.lower().strip() == "csv":
-            output = io.StringIO()
-            captions = [view_name] + list(list(stats_obj.get_flat_stats().values())[0].keys())
-            writer = csv.DictWriter(output, captions)
-            writer.writeheader()
-            for obj_name in stats_obj.get_flat_stats():
-                row = {view_name: obj_name}
-                row.update((stats_obj.get_flat_stats()[obj_name]))
-                writer.writerow(row)
-            attach_stats_csv(context, self.logger, view_name, output.getvalue().strip())
-            return output.getvalue().strip()
+            statistics_csv = _flat_stats_to_csv(view_name, stats_obj.get_flat_stats())
+            attach_stats_csv(context, self.logger, view_name, statistics_csv)
+            return statistics_csv
         raise TgnError(f"Output type should be CSV/JSON - got '{output_type}'")
 
+    def _get_all_statistics(self, context: ResourceCommandContext, output_type: str) -> Union[dict, str]:
+        """Read all statistics views of all ports concurrently and return them as one snapshot.
+
+        Streams and TPLDs are resolved sequentially first, as resolving them modifies the objects tree. Then one worker
+        per port reads its port, streams and TPLDs statistics, each object exactly once. Statistics reads do not modify
+        the objects tree and each chassis socket serializes its queries, so workers of different chassis run in parallel
+        and workers of the same chassis interleave safely. The snapshot is stamped with the start and end times of the
+        read window.
+        """
+        if output_type.lower().strip() not in ["json", "csv"]:
+            raise TgnError(f"Output type should be CSV/JSON - got '{output_type}'")
+        ports = [
+            (port, list(port.streams.values()), list(port.tplds.values()))
+            for chassis in self.xena.session.chassis_list.values()
+            for port in chassis.ports.values()
+        ]
+        start_time = datetime.now(timezone.utc).isoformat()
+        with ThreadPoolExecutor(max_workers=len(ports) or 1) as executor:
+            ports_stats = list(executor.map(lambda port_objects: _read_port_statistics(*port_objects), ports))
+        end_time = datetime.now(timezone.utc).isoformat()
+        self.logger.debug(f"All statistics views of {len(ports)} ports read between {start_time} and {end_time}")
+        all_stats: dict = {view: {} for view in view_name_2_object}
+        for port_stats in ports_stats:
+            for view, flat_stats in port_stats.items():
+                all_stats[view].update(flat_stats)
+        if output_type.lower().strip() == "json":
+            snapshot = {"start_time": start_time, "end_time": end_time, **all_stats}
+            statistics_str = json.dumps(snapshot, indent=4, sort_keys=True, ensure_ascii=False)
+            return json.loads(statistics_str)
+        times = {"start_time": start_time, "end_time": end_time}
+        views_csv = []
+        for view, flat_stats in all_stats.items():
+            view_csv = _flat_stats_to_csv(view, flat_stats, times)
+            attach_stats_csv(context, self.logger, f"all_{view}", view_csv)
+            views_csv.append(view_csv)
+        return "\n\n".join(views_csv)
+
     # pylint: disable=too-many-locals
     def run_rfc(self, context: ResourceCommandContext, test: str, config_file_location: str) -> None:
         """Run RFC test."""
@@ -136,4 +176,40 @@ class XenaHandler:
             )
 
 
+def _read_port_statistics(port: XenaPort, streams: list, tplds: list) -> dict:
+    """Read statistics of a single port and its resolved streams and TPLDs, one read per object.
+
+    Returns flat statistics keyed as in the single views - port and TPLD counters as <group>_<counter>.
+    """
+    return {
+        "port": {port.name: _flatten_group_stats(port.read_port_stats())},
+        "stream": {str(stream): stream.read_stats() for stream in streams},
+        "tpld": {tpld.name: _flatten_group_stats(tpld.read_stats()) for tpld in tplds},
+    }
+
+
+def _flatten_group_stats(group_stats: dict) -> dict:
+    """Flatten {group: {counter: value}} statistics to {<group>_<counter>: value}."""
+    return {f"{group}_{counter}": value for group, counters in group_stats.items() for counter, value in counters.items()}
+
+
+def _flat_stats_to_csv(view_name: str, flat_stats: dict, common_columns: Optional[dict] = None) -> str:
+    """Convert flat statistics dictionary to CSV string with the view name as the first column.
+
+    :param common_columns: Columns with the same value in all rows, added after the view name column.
+    """
+    common_columns = common_columns or {}
+    output = io.StringIO()
+    obj_captions = list(list(flat_stats.values())[0].keys()) if flat_stats else []
+    captions = [view_name] + list(common_columns.keys()) + obj_captions
+    writer = csv.DictWriter(output, captions)
+    writer.writeheader()
+    for obj_name, obj_stats in flat_stats.items():
+        row = {view_name: obj_name}
+        row.update(common_columns)
+        row.update(obj_stats)
+        writer.writerow(row)
+    return output.getvalue().strip()
+
+
 view_name_2_object = {"port": XenaPortsStats, "stream": XenaStreamsStats, "tpld": XenaTpldsStats}
@@ -2,8 +2,11 @@
 Tests for XenaController2GDriver.
 """
 # pylint: disable=redefined-outer-name,no-self-use
+import csv
+import io
 import json
 import logging
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
@@ -15,6 +18,7 @@ from cloudshell.traffic.helpers import get_location, get_reservation_id, get_res
 from cloudshell.traffic.rest_api_helpers import SandboxAttachments
 from cloudshell.traffic.tg import XENA_CHASSIS_MODEL, XENA_CONTROLLER_MODEL
 from shellfoundry_traffic.test_helpers import TestHelpers, session, test_helpers  # noqa: F401
+from trafficgenerator.tgn_utils import TgnError
 
 from src.xena_driver import XenaController2GDriver
 
@@ -72,6 +76,11 @@ def context(
     return context
 
 
+def assert_snapshot_window(start_time: str, end_time: str, before: datetime, after: datetime) -> None:
+    """Assert that the snapshot read window is within the command call window."""
+    assert before <= datetime.fromisoformat(start_time) <= datetime.fromisoformat(end_time) <= after
+
+
 class TestXenaController2GDriverDriver:
     """Test direct driver calls."""
 
@@ -93,6 +102,24 @@ class TestXenaController2GDriverDriver:
         tpld_stats = driver.get_statistics(context, "TPLD", "JSON")
         tpld_name = get_location(reservation_ports[0])[-3:] + "/0"
         assert int(tpld_stats[tpld_name]["pr_tpldtraffic_pac"]) == 8000
+        before = datetime.now(timezone.utc)
+        all_stats = driver.get_statistics(context, "All", "JSON")
+        after = datetime.now(timezone.utc)
+        assert_snapshot_window(all_stats["start_time"], all_stats["end_time"], before, after)
+        assert int(all_stats["port"][port_name]["pt_total_packets"]) == 16000
+        assert int(all_stats["stream"]["Stream 1-1"]["packets"]) == 8000
+        assert int(all_stats["tpld"][tpld_name]["pr_tpldtraffic_pac"]) == 8000
+        before = datetime.now(timezone.utc)
+        all_stats_csv = driver.get_statistics(context, "All", "CSV")
+        after = datetime.now(timezone.utc)
+        port_rows, stream_rows, tpld_rows = [list(csv.DictReader(io.StringIO(v))) for v in all_stats_csv.split("\n\n")]
+        assert_snapshot_window(port_rows[0]["start_time"], port_rows[0]["end_time"], before, after)
+        assert {r["start_time"] for r in port_rows + stream_rows + tpld_rows} == {port_rows[0]["start_time"]}
+        assert int([r for r in port_rows if r["port"] == port_name][0]["pt_total_packets"]) == 16000
+        assert int([r for r in stream_rows if r["stream"] == "Stream 1-1"][0]["packets"]) == 8000
+        assert int([r for r in tpld_rows if r["tpld"] == tpld_name][0]["pr_tpldtraffic_pac"]) == 8000
+        with pytest.raises(TgnError):
+            driver.get_statistics(context, "Invalid", "JSON")
 
         driver.start_traffic(context, "False")
         stats = driver.get_statistics(context, "Port", "JSON")
@@ -137,6 +164,15 @@ class TestIxNetworkControllerShell:
         tpld_stats = session.ExecuteCommand(get_reservation_id(context), ALIAS, "Service", "get_statistics", cmd_inputs)
         tpld_name = get_location(reservation_ports[0])[-3:] + "/0"
         assert int(json.loads(tpld_stats.Output)[tpld_name]["pr_tpldtraffic_pac"]) == 8000
+        cmd_inputs = [InputNameValue("view_name", "All"), InputNameValue("output_type", "JSON")]
+        before = datetime.now(timezone.utc)
+        all_stats = session.ExecuteCommand(get_reservation_id(context), ALIAS, "Service", "get_statistics", cmd_inputs)
+        after = datetime.now(timezone.utc)
+        all_stats = json.loads(all_stats.Output)
+        assert_snapshot_window(all_stats["start_time"], all_stats["end_time"], before, after)
+        assert int(all_stats["port"][port_name]["pt_total_packets"]) == 16000
+        assert int(all_stats["stream"]["Stream 1-1"]["packets"]) == 8000
+        assert int(all_stats["tpld"][tpld_name]["pr_tpldtraffic_pac"]) == 8000
 
         cmd_inputs = [InputNameValue("blocking", "False")]
         session.ExecuteCommand(get_reservation_id(context), ALIAS, "Service", "start_traffic", cmd_inputs)
@@ -0,0 +1,104 @@
+"""
+Tests for XenaHandler statistics snapshot logic with stubbed Xena session.
+"""
+# pylint: disable=redefined-outer-name,no-self-use
+import csv
+import io
+import logging
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+from src import xena_handler
+from src.xena_handler import XenaHandler
+
+reads: Counter = Counter()
+
+
+class StubObject:
+    """Stub stream/TPLD that counts its statistics reads."""
+
+    def __init__(self, name: str, stats: dict) -> None:
+        """Create stub object with fixed statistics."""
+        self.name = name
+        self.stats = stats
+
+    def __str__(self) -> str:
+        """Return object name."""
+        return self.name
+
+    def read_stats(self) -> dict:
+        """Count read and return stub statistics."""
+        reads[self.name] += 1
+        return self.stats
+
+
+class StubPort(StubObject):
+    """Stub port with one stream and one TPLD that counts its statistics reads and its streams/TPLDs resolutions."""
+
+    def __init__(self, name: str) -> None:
+        """Create stub port, stream and TPLD."""
+        super().__init__(name, {"pt_total": {"packets": 1}})
+        self.stream = StubObject(f"{name} stream", {"packets": 1})
+        self.tpld = StubObject(f"{name}/0", {"pr_tpldtraffic": {"pac": 1}})
+
+    read_port_stats = StubObject.read_stats
+
+    @property
+    def streams(self) -> dict:
+        """Count resolution and return streams."""
+        reads[f"{self.name} streams"] += 1
+        return {0: self.stream}
+
+    @property
+    def tplds(self) -> dict:
+        """Count resolution and return TPLDs."""
+        reads[f"{self.name} tplds"] += 1
+        return {0: self.tpld}
+
+
+@pytest.fixture
+def handler(monkeypatch: MonkeyPatch) -> XenaHandler:
+    """Yield XenaHandler over stubbed session with two chassis, each with two disjoint ports."""
+    reads.clear()
+    monkeypatch.setattr(xena_handler, "attach_stats_csv", lambda *args: None)
+    chassis_list = {
+        chassis: SimpleNamespace(ports={f"{chassis}/0/{p}": StubPort(f"{chassis}/0/{p}") for p in range(2)})
+        for chassis in ["chassis1", "chassis2"]
+    }
+    handler = XenaHandler()
+    handler.logger = logging.getLogger()
+    handler.xena = SimpleNamespace(session=SimpleNamespace(chassis_list=chassis_list))
+    return handler
+
+
+ports = [f"{chassis}/0/{p}" for chassis in ["chassis1", "chassis2"] for p in range(2)]
+
+
+class TestAllStatistics:
+    """Test all views snapshot."""
+
+    def test_json(self, handler: XenaHandler) -> None:
+        """Test each object is read exactly once and appears exactly once in the JSON snapshot."""
+        all_stats = handler.get_statistics(None, "All", "JSON")
+        assert all_stats["start_time"] <= all_stats["end_time"]
+        assert sorted(all_stats["port"]) == ports
+        assert sorted(all_stats["stream"]) == [f"{port} stream" for port in ports]
+        assert sorted(all_stats["tpld"]) == [f"{port}/0" for port in ports]
+        assert all(s == {"pt_total_packets": 1} for s in all_stats["port"].values())
+        assert all(s == {"packets": 1} for s in all_stats["stream"].values())
+        assert all(s == {"pr_tpldtraffic_pac": 1} for s in all_stats["tpld"].values())
+        assert len(reads) == 5 * len(ports)
+        assert set(reads.values()) == {1}
+
+    def test_csv(self, handler: XenaHandler) -> None:
+        """Test each object is read exactly once and appears exactly once in the CSV snapshot."""
+        all_stats_csv = handler.get_statistics(None, " all ", "CSV")
+        port_rows, stream_rows, tpld_rows = [list(csv.DictReader(io.StringIO(v))) for v in all_stats_csv.split("\n\n")]
+        assert sorted(r["port"] for r in port_rows) == ports
+        assert sorted(r["stream"] for r in stream_rows) == [f"{port} stream" for port in ports]
+        assert sorted(r["tpld"] for r in tpld_rows) == [f"{port}/0" for port in ports]
+        assert len({(r["start_time"], r["end_time"]) for r in port_rows + stream_rows + tpld_rows}) == 1
+        assert set(reads.values()) == {1}